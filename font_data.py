@@ -0,0 +1,201 @@
+# Generated by tools/gen_font.py, edit the glyphs there and rerun it.
+
+# one glyph per printable ASCII character, indexed by digit. Bit x * 7 + y
+# is the pixel in column x and row y, so a glyph's bits follow the same
+# week per column day order as the contribution graph.
+GLYPHS = (
+    0x0,  # ' '
+    0x2E,  # '!'
+    0x18006,  # '"'
+    0x147C51F14,  # '#'
+    0x1255FD524,  # '$'
+    0x326820B26,  # '%'
+    0x7045666B2,  # '&'
+    0x6,  # "'"
+    0x20BE,  # '('
+    0x1F41,  # ')'
+    0x10704,  # '*'
+    0x20E08,  # '+'
+    0x60,  # ','
+    0x20408,  # '-'
+    0x20,  # '.'
+    0x20820820,  # '/'
+    0x388911C,  # '0'
+    0x81F24,  # '1'
+    0x48A9134,  # '2'
+    0x28A9522,  # '3'
+    0x20F8A18,  # '4'
+    0x24A952E,  # '5'
+    0x20A951C,  # '6'
+    0xC28922,  # '7'
+    0x28A9514,  # '8'
+    0x38A8504,  # '9'
+    0x14,  # ':'
+    0x34,  # ';'
+    0x88A08,  # '<'
+    0x50A14,  # '='
+    0x20A22,  # '>'
+    0x8A8100,  # '?'
+    0x1C24F911C,  # '@'
+    0x782853C,  # 'A'
+    0x28A953E,  # 'B'
+    0x448911C,  # 'C'
+    0x105113E,  # 'D'
+    0x44A953E,  # 'E'
+    0x42853E,  # 'F'
+    0x74A911C,  # 'G'
+    0x7C2043E,  # 'H'
+    0x89F22,  # 'I'
+    0x3C81010,  # 'J'
+    0x445043E,  # 'K'
+    0x408103E,  # 'L'
+    0x3C043013C,  # 'M'
+    0x3E202023E,  # 'N'
+    0x388911C,  # 'O'
+    0x82853E,  # 'P'
+    0xB8C911C,  # 'Q'
+    0x486853E,  # 'R'
+    0x24A9524,  # 'S'
+    0x9F02,  # 'T'
+    0x3C8101E,  # 'U'
+    0x1C4101E,  # 'V'
+    0x1E406101E,  # 'W'
+    0x222820A22,  # 'X'
+    0x19C06,  # 'Y'
+    0x4499532,  # 'Z'
+    0x20FF,  # '['
+    0x202020202,  # '\\'
+    0x3FC1,  # ']'
+    0x10104,  # '^'
+    0x81020,  # '_'
+    0x202,  # '`'
+    0x78A9510,  # 'a'
+    0x20A143E,  # 'b'
+    0xA1410,  # 'c'
+    0x7CA1410,  # 'd'
+    0x50B1618,  # 'e'
+    0x429E08,  # 'f'
+    0x7952A08,  # 'g'
+    0x602043E,  # 'h'
+    0x3A,  # 'i'
+    0xEA040,  # 'j'
+    0xA083E,  # 'k'
+    0x3E,  # 'l'
+    0x301040430,  # 'm'
+    0x6020430,  # 'n'
+    0x20A1410,  # 'o'
+    0x1050A78,  # 'p'
+    0xF050A08,  # 'q'
+    0x20430,  # 'r'
+    0x28D1228,  # 's'
+    0x21F08,  # 't'
+    0x3081018,  # 'u'
+    0x1041018,  # 'v'
+    0x184041018,  # 'w'
+    0xA0828,  # 'x'
+    0x71404,  # 'y'
+    0x91634,  # 'z'
+    0x107B88,  # '{'
+    0x3E,  # '|'
+    0x23BC1,  # '}'
+    0x2081010208,  # '~'
+)
+
+# the number of columns in each glyph
+WIDTHS = (
+    2,  # ' '
+    1,  # '!'
+    3,  # '"'
+    5,  # '#'
+    5,  # '$'
+    5,  # '%'
+    5,  # '&'
+    1,  # "'"
+    2,  # '('
+    2,  # ')'
+    3,  # '*'
+    3,  # '+'
+    1,  # ','
+    3,  # '-'
+    1,  # '.'
+    5,  # '/'
+    4,  # '0'
+    3,  # '1'
+    4,  # '2'
+    4,  # '3'
+    4,  # '4'
+    4,  # '5'
+    4,  # '6'
+    4,  # '7'
+    4,  # '8'
+    4,  # '9'
+    1,  # ':'
+    1,  # ';'
+    3,  # '<'
+    3,  # '='
+    3,  # '>'
+    4,  # '?'
+    5,  # '@'
+    4,  # 'A'
+    4,  # 'B'
+    4,  # 'C'
+    4,  # 'D'
+    4,  # 'E'
+    4,  # 'F'
+    4,  # 'G'
+    4,  # 'H'
+    3,  # 'I'
+    4,  # 'J'
+    4,  # 'K'
+    4,  # 'L'
+    5,  # 'M'
+    5,  # 'N'
+    4,  # 'O'
+    4,  # 'P'
+    4,  # 'Q'
+    4,  # 'R'
+    4,  # 'S'
+    3,  # 'T'
+    4,  # 'U'
+    4,  # 'V'
+    5,  # 'W'
+    5,  # 'X'
+    3,  # 'Y'
+    4,  # 'Z'
+    2,  # '['
+    5,  # '\\'
+    2,  # ']'
+    3,  # '^'
+    3,  # '_'
+    2,  # '`'
+    4,  # 'a'
+    4,  # 'b'
+    3,  # 'c'
+    4,  # 'd'
+    4,  # 'e'
+    4,  # 'f'
+    4,  # 'g'
+    4,  # 'h'
+    1,  # 'i'
+    3,  # 'j'
+    3,  # 'k'
+    1,  # 'l'
+    5,  # 'm'
+    4,  # 'n'
+    4,  # 'o'
+    4,  # 'p'
+    4,  # 'q'
+    3,  # 'r'
+    4,  # 's'
+    3,  # 't'
+    4,  # 'u'
+    4,  # 'v'
+    5,  # 'w'
+    3,  # 'x'
+    3,  # 'y'
+    3,  # 'z'
+    3,  # '{'
+    1,  # '|'
+    3,  # '}'
+    6,  # '~'
+)
@@ -2,35 +2,51 @@
 
 import argparse
 from datetime import datetime, timedelta
+import hashlib
 import random
+import struct
 import subprocess
 import sys
-from time import sleep
+from time import localtime, mktime, sleep, strftime
+import zlib
+
+from font_data import GLYPHS, WIDTHS
 
 ASCII_PRINTABLE_FIRST = 32  # space
 ASCII_PRINTABLE_LAST = 126  # tilde
 ESC = chr(0x1B)
+# every state of the 25 wide progress bar, indexed by the number of "="
+PROGRESS_BARS = ["=" * i + " " * (25 - i) for i in range(26)]
+# the preview only ever moves between the 7 grid rows, so every vertical
+# cursor move is known up front, horizontal ones are cached as they're used
+CURSOR_UP = tuple(f"{ESC}[{n}A".encode() if n > 0 else b"" for n in range(8))
+CURSOR_DOWN = tuple(f"{ESC}[{n}B".encode() if n > 0 else b"" for n in range(8))
+CURSOR_RIGHT = {}
+# object type numbers used in pack entries
+PACK_OBJECT_TYPES = {"commit": 1, "tree": 2}
 
 
 def main():
     args = parse_args()
-    font = get_font()
-
-    grid = []
-    for row in range(7):
-        row_text = "."
 
-        for char in args.message:
-            digit = ord(char) - ASCII_PRINTABLE_FIRST
-            font_letter = font[digit]
-            row_text += font_letter[row] + "."
+    # one bit per day, a week per column like the contribution graph, so
+    # each glyph is shifted into place whole, with a blank column before the
+    # message and after every letter
+    grid = 0
+    num_days = 7
 
-        if args.invert:
-            row_text = "".join(["#" if c == "." else "." for c in row_text])
+    for char in args.message:
+        digit = ord(char) - ASCII_PRINTABLE_FIRST
+        grid |= GLYPHS[digit] << num_days
+        num_days += (WIDTHS[digit] + 1) * 7
 
-        grid.append(row_text)
+    if args.invert:
+        grid ^= (1 << num_days) - 1
 
-    num_days = len(grid) * len(grid[0])
+    # the days with a pixel drawn on them, blank days need no work at all.
+    # bin() lists the bits from the last day back, reversed it reads day by day
+    bits = bin(grid)[:1:-1]
+    active_days = [day for day, bit in enumerate(bits) if bit == "1"]
     beginning = datetime.fromisoformat(args.start).replace(
         hour=12, minute=0, second=0, microsecond=0
     )
@@ -42,52 +58,125 @@ def main():
     print(f"Starting on {beginning.strftime('%a %b %d %H:%M:%S %Z %Y')}")
     print(f"Ending on   {end.strftime('%a %b %d %H:%M:%S %Z %Y')}")
 
-    if args.preview:
-        # make room for the preview lines
-        for _ in range(len(grid)):
-            print("")
+    dry_run = args.dry_run
+    preview = args.preview
 
-    for day in range(num_days):
-        y = day % 7
-        x = day // 7
-        row = grid[y]
-        char = row[x]
-        the_date = (beginning + timedelta(days=day)).strftime("%Y-%m-%d %H:%M:%S")
+    if not dry_run:
+        # roll the commit count of every drawn day up front
+        commit_counts = iter(
+            random.choices(
+                range(args.min_commits, args.max_commits + 1),
+                k=len(active_days),
+            )
+        )
+
+        # the contribution graph credits commits by their author, which can
+        # differ from the committer
+        author = git_output("var", "GIT_AUTHOR_IDENT").rsplit(" ", 2)[0]
+        committer = git_output("var", "GIT_COMMITTER_IDENT").rsplit(" ", 2)[0]
+
+        # commits are collected into a single pack, git only sees them once
+        # they're all made
+        pack = []
 
-        print(f"\r{the_date} {progress(day * 100 / num_days)}", end="")
+        # resolve the object format, the current commit and its tree with a
+        # single git process
+        head = git_output(
+            "rev-parse", "--show-object-format", "HEAD", "HEAD^{tree}", check=False
+        ).splitlines()
 
-        if char == ".":
-            continue
+        if not head:
+            eprint("Unable to read HEAD, run this inside a git repository")
+            sys.exit(1)
 
-        if not args.dry_run:
-            commits_diff = args.max_commits - args.min_commits + 1
-            num_commits = args.min_commits + random.randrange(commits_diff)
+        object_format = head[0]
+
+        if len(head) == 3:
+            parent, tree = head[1:]
+        else:
+            # an unborn branch starts from the empty tree
+            parent = None
+            tree = pack_object(pack, object_format, "tree", b"")
+
+        tip = parent
+        tree_line = f"tree {tree}\n".encode()
+        before_parent = tree_line + b"parent "
+
+    if preview:
+        # make room for the preview lines
+        for _ in range(7):
+            print("")
+
+    # terminal output is collected and written out together with the
+    # progress bar, instead of one write per print
+    output = []
+    # written as bytes below the text layer, which needs to be empty first
+    stdout = sys.stdout.buffer
+    sys.stdout.flush()
+
+    # mktime() normalizes the day of the month past its end, so each day is
+    # found from the first one without any datetime arithmetic, still at noon
+    # on both sides of a daylight saving change
+    year, month, month_day = beginning.year, beginning.month, beginning.day
+
+    for i, day in enumerate(active_days):
+        timestamp = int(mktime((year, month, month_day + day, 12, 0, 0, 0, 0, -1)))
+        day_time = localtime(timestamp)
+        the_date = strftime("%Y-%m-%d %H:%M:%S", day_time)
+
+        # the bar only moves every few days, so skip redrawing the rest
+        if i & 0x0F == 0:
+            output.append(f"\r{the_date} {progress(day * 100 / num_days)}".encode())
+            stdout.write(b"".join(output))
+            stdout.flush()
+            output.clear()
+
+        if not dry_run:
+            num_commits = next(commit_counts)
+            when = f"{timestamp} {strftime('%z', day_time)}"
+
+            # the commits of a day only differ by their parent, so everything
+            # after the parent id is formatted once per day
+            signature = (
+                f"author {author} {when}\n"
+                f"committer {committer} {when}\n"
+                f"\n"
+                f"{the_date}\n"
+            ).encode()
+            after_parent = b"\n" + signature
 
             for _ in range(num_commits):
-                subprocess.run(
-                    [
-                        "git",
-                        "commit",
-                        "--allow-empty",
-                        f"--date={the_date}",
-                        "--message",
-                        the_date,
-                    ],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                if tip:
+                    commit = before_parent + tip.encode() + after_parent
+                else:
+                    # the root commit of an unborn branch
+                    commit = tree_line + signature
+
+                tip = pack_object(pack, object_format, "commit", commit)
         else:
             # artificial deplay just to show progress working
             sleep(0.002)
 
-        if args.preview:
-            print("\r", end="")
-            cursor_up(7 - y)
-            cursor_right(x)
-            print(char, end="")
-            cursor_down(7 - y)
+        if preview:
+            # the column and row are only needed to draw the pixel
+            x, y = divmod(day, 7)
+            output.append(
+                b"\r" + cursor_up(7 - y) + cursor_right(x) + b"#" + cursor_down(7 - y)
+            )
+
+    output.append(f"\r{end.strftime('%Y-%m-%d %H:%M:%S')} {progress(100)}".encode())
+    stdout.write(b"".join(output))
+    stdout.flush()
+
+    if not dry_run and tip != parent:
+        if not write_pack(pack, object_format):
+            print("")
+            eprint("git index-pack failed, no commits were written")
+            sys.exit(1)
 
-    print(f"\r{the_date} {progress(100)}", end="")
+        # updates the checked out branch, a detached HEAD, or creates an
+        # unborn branch
+        git_output("update-ref", "HEAD", tip, parent or "")
 
 
 def parse_args():
@@ -179,803 +268,80 @@ def parse_args():
 
 
 def progress(percent):
-    bar = ""
-    for i in range(25):
-        if i * 4 <= percent:
-            bar += "="
-        else:
-            bar += " "
+    bar = PROGRESS_BARS[min(25, int(percent) // 4 + 1)]
 
     return f"[{bar}] {int(percent)}%"
 
 
+def git_output(*args, check=True):
+    result = subprocess.run(
+        ["git", *args],
+        stdout=subprocess.PIPE,
+        # unchecked commands are allowed to fail, so keep their errors quiet
+        stderr=None if check else subprocess.DEVNULL,
+        text=True,
+    )
+
+    if check and result.returncode != 0:
+        # git has already reported the problem on stderr
+        sys.exit(1)
+
+    return result.stdout.strip()
+
+
+def pack_object(pack, object_format, object_type, content):
+    data = f"{object_type} {len(content)}\0".encode() + content
+    # object ids only need to match git's, not to be secure, which lets
+    # hashlib pick its fastest implementation
+    object_id = hashlib.new(object_format, data, usedforsecurity=False).hexdigest()
+
+    # an entry starts with its type and size, 4 bits of the size in the first
+    # byte and 7 in each following one, the top bit marking that more follow
+    size = len(content)
+    entry = bytearray([PACK_OBJECT_TYPES[object_type] << 4 | size & 0x0F])
+    size >>= 4
+
+    while size:
+        entry[-1] |= 0x80
+        entry.append(size & 0x7F)
+        size >>= 7
+
+    # git reads any compression level, and for objects this small the
+    # fastest one costs next to nothing in size
+    pack.append(bytes(entry) + zlib.compress(content, 1))
+
+    return object_id
+
+
+def write_pack(pack, object_format):
+    data = b"PACK" + struct.pack(">II", 2, len(pack)) + b"".join(pack)
+    data += hashlib.new(object_format, data, usedforsecurity=False).digest()
+
+    # index-pack checks every object, then stores the pack with its index
+    result = subprocess.run(
+        ["git", "index-pack", "--stdin"], input=data, stdout=subprocess.DEVNULL
+    )
+
+    return result.returncode == 0
+
+
 def eprint(*args, **kwargs):
     print(*args, **kwargs, file=sys.stderr)
 
 
 def cursor_up(n):
-    if n > 0:
-        print(f"{ESC}[{n}A", end="")
+    return CURSOR_UP[n]
 
 
 def cursor_down(n):
-    if n > 0:
-        print(f"{ESC}[{n}B", end="")
+    return CURSOR_DOWN[n]
 
 
 def cursor_right(n):
-    if n > 0:
-        print(f"{ESC}[{n}C", end="")
-
-
-def get_font():
-    font = """
-        ..
-        ..
-        ..
-        ..
-        ..
-        ..
-        ..
-
-        .
-        #
-        #
-        #
-        .
-        #
-        .
-
-        ...
-        #.#
-        #.#
-        ...
-        ...
-        ...
-        ...
-
-        .....
-        .#.#.
-        #####
-        .#.#.
-        #####
-        .#.#.
-        .....
-
-        ..#..
-        .####
-        #.#..
-        .###.
-        ..#.#
-        ####.
-        ..#..
-
-        .....
-        ##..#
-        ##.#.
-        ..#..
-        .#.##
-        #..##
-        .....
-
-        .##..
-        #..#.
-        .#...
-        .##..
-        #.#.#
-        #..##
-        .##.#
-
-        .
-        #
-        #
-        .
-        .
-        .
-        .
-
-
-        .#
-        #.
-        #.
-        #.
-        #.
-        #.
-        .#
-
-
-        #.
-        .#
-        .#
-        .#
-        .#
-        .#
-        #.
-
-        ...
-        .#.
-        ###
-        .#.
-        ...
-        ...
-        ...
-
-        ...
-        ...
-        .#.
-        ###
-        .#.
-        ...
-        ...
-
-        .
-        .
-        .
-        .
-        .
-        #
-        #
-
-        ...
-        ...
-        ...
-        ###
-        ...
-        ...
-        ...
-
-        .
-        .
-        .
-        .
-        .
-        #
-        .
-
-        .....
-        ....#
-        ...#.
-        ..#..
-        .#...
-        #....
-        .....
-
-        ....
-        .##.
-        #..#
-        #..#
-        #..#
-        .##.
-        ....
-
-        ...
-        .#.
-        ##.
-        .#.
-        .#.
-        ###
-        ...
-
-        ....
-        .##.
-        #..#
-        ..#.
-        #...
-        ####
-        ....
-
-        ....
-        ###.
-        ...#
-        .##.
-        ...#
-        ###.
-        ....
-
-        ....
-        ..#.
-        .##.
-        #.#.
-        ####
-        ..#.
-        ....
-
-        ....
-        ####
-        #...
-        ###.
-        ...#
-        ###.
-        ....
-
-        ....
-        .##.
-        #...
-        ###.
-        #..#
-        .##.
-        ....
-
-        ....
-        ####
-        ...#
-        ..#.
-        .#..
-        #...
-        ....
-
-        ....
-        .##.
-        #..#
-        .##.
-        #..#
-        .##.
-        ....
-
-        ....
-        .##.
-        #..#
-        .###
-        ...#
-        ..#.
-        ....
-
-        .
-        .
-        #
-        .
-        #
-        .
-        .
-
-        .
-        .
-        #
-        .
-        #
-        #
-        .
-
-        ...
-        ..#
-        .#.
-        #..
-        .#.
-        ..#
-        ...
-
-        ...
-        ...
-        ###
-        ...
-        ###
-        ...
-        ...
-
-        ...
-        #..
-        .#.
-        ..#
-        .#.
-        #..
-        ...
-
-        ....
-        .##.
-        ...#
-        ..#.
-        ....
-        ..#.
-        ....
-
-        .....
-        .###.
-        #.#.#
-        #.#.#
-        #.###
-        .##..
-        .....
-
-        ....
-        .##.
-        #..#
-        ####
-        #..#
-        #..#
-        ....
-
-        ....
-        ###.
-        #..#
-        ###.
-        #..#
-        ###.
-        ....
-
-        ....
-        .###
-        #...
-        #...
-        #...
-        .###
-        ....
-
-        ....
-        ##..
-        #.#.
-        #..#
-        #.#.
-        ##..
-        ....
-
-        ....
-        ####
-        #...
-        ###.
-        #...
-        ####
-        ....
-
-        ....
-        ####
-        #...
-        ###.
-        #...
-        #...
-        ....
-
-        ....
-        .###
-        #...
-        #.##
-        #..#
-        .###
-        ....
-
-        ....
-        #..#
-        #..#
-        ####
-        #..#
-        #..#
-        ....
-
-        ...
-        ###
-        .#.
-        .#.
-        .#.
-        ###
-        ...
-
-        ....
-        ...#
-        ...#
-        ...#
-        #..#
-        .##.
-        ....
-
-        ....
-        #..#
-        #.#.
-        ##..
-        #.#.
-        #..#
-        ....
-
-        ....
-        #...
-        #...
-        #...
-        #...
-        ####
-        ....
-
-        .....
-        .#.#.
-        #.#.#
-        #.#.#
-        #...#
-        #...#
-        .....
-
-        .....
-        #...#
-        ##..#
-        #.#.#
-        #..##
-        #...#
-        .....
-
-        ....
-        .##.
-        #..#
-        #..#
-        #..#
-        .##.
-        ....
-
-        ....
-        ###.
-        #..#
-        ###.
-        #...
-        #...
-        ....
-
-        ....
-        .##.
-        #..#
-        #..#
-        #.##
-        .##.
-        ...#
-
-        ....
-        ###.
-        #..#
-        ###.
-        #.#.
-        #..#
-        ....
-
-        ....
-        .###
-        #...
-        .##.
-        ...#
-        ###.
-        ....
-
-        ...
-        ###
-        .#.
-        .#.
-        .#.
-        .#.
-        ...
-
-        ....
-        #..#
-        #..#
-        #..#
-        #..#
-        .##.
-        ....
-
-        ....
-        #..#
-        #..#
-        #..#
-        #.#.
-        .#..
-        ....
-
-        .....
-        #...#
-        #...#
-        #.#.#
-        #.#.#
-        .#.#.
-        .....
-
-        .....
-        #...#
-        .#.#.
-        ..#..
-        .#.#.
-        #...#
-        .....
-
-        ...
-        #.#
-        #.#
-        .#.
-        .#.
-        .#.
-        ...
-
-        ....
-        ####
-        ..#.
-        .#..
-        #...
-        ####
-        ....
-
-        ##
-        #.
-        #.
-        #.
-        #.
-        #.
-        ##
-
-        .....
-        #....
-        .#...
-        ..#..
-        ...#.
-        ....#
-        .....
-
-        ##
-        .#
-        .#
-        .#
-        .#
-        .#
-        ##
-
-        ...
-        .#.
-        #.#
-        ...
-        ...
-        ...
-        ...
-
-        ...
-        ...
-        ...
-        ...
-        ...
-        ###
-        ...
-
-        ..
-        #.
-        .#
-        ..
-        ..
-        ..
-        ..
-
-        ....
-        .##.
-        ...#
-        .###
-        #..#
-        .###
-        ....
-
-        ....
-        #...
-        #...
-        ###.
-        #..#
-        ###.
-        ....
-
-        ...
-        ...
-        ...
-        .##
-        #..
-        .##
-        ...
-
-        ....
-        ...#
-        ...#
-        .###
-        #..#
-        .###
-        ....
-
-        ....
-        ....
-        .##.
-        ####
-        #...
-        .###
-        ....
-
-        ....
-        ..##
-        .#..
-        ###.
-        .#..
-        .#..
-        ....
-
-        ....
-        ....
-        .###
-        #..#
-        .###
-        ...#
-        .##.
-
-        ....
-        #...
-        #...
-        ###.
-        #..#
-        #..#
-        ....
-
-        .
-        #
-        .
-        #
-        #
-        #
-        .
-
-        ...
-        ..#
-        ...
-        ..#
-        ..#
-        ..#
-        ##.
-
-        ...
-        #..
-        #..
-        #.#
-        ##.
-        #.#
-        ...
-
-        .
-        #
-        #
-        #
-        #
-        #
-        .
-
-        .....
-        .....
-        .....
-        .#.#.
-        #.#.#
-        #...#
-        .....
-
-        ....
-        ....
-        ....
-        .##.
-        #..#
-        #..#
-        ....
-
-        ....
-        ....
-        ....
-        .##.
-        #..#
-        .##.
-        ....
-
-        ....
-        ....
-        .##.
-        #..#
-        ###.
-        #...
-        #...
-
-        ....
-        ....
-        .##.
-        #..#
-        .###
-        ...#
-        ...#
-
-        ...
-        ...
-        ...
-        .##
-        #..
-        #..
-        ...
-
-        ....
-        ....
-        .###
-        #...
-        ..##
-        ###.
-        ....
-
-        ...
-        .#.
-        .#.
-        ###
-        .#.
-        .#.
-        ...
-
-        ....
-        ....
-        ....
-        #..#
-        #..#
-        .##.
-        ....
-
-        ....
-        ....
-        ....
-        #..#
-        #.#.
-        .#..
-        ....
-
-        .....
-        .....
-        .....
-        #...#
-        #.#.#
-        .#.#.
-        .....
-
-        ...
-        ...
-        ...
-        #.#
-        .#.
-        #.#
-        ...
-
-        ...
-        ...
-        #.#
-        .##
-        ..#
-        .#.
-        ...
-
-        ...
-        ...
-        ###
-        .#.
-        #..
-        ###
-        ...
-
-        .##
-        .#.
-        .#.
-        #..
-        .#.
-        .#.
-        .##
-
-        .
-        #
-        #
-        #
-        #
-        #
-        .
-
-        ##.
-        .#.
-        .#.
-        ..#
-        .#.
-        .#.
-        ##.
-
-        ......
-        ......
-        .##..#
-        #..##.
-        ......
-        ......
-        ......
-    """.split(
-        "\n\n"
-    )
+    if n not in CURSOR_RIGHT:
+        CURSOR_RIGHT[n] = f"{ESC}[{n}C".encode() if n > 0 else b""
 
-    return [[row.strip() for row in char.split()] for char in font]
+    return CURSOR_RIGHT[n]
 
 
 main()
@@ -0,0 +1,814 @@
+#!/usr/bin/env python3
+
+# Regenerates font_data.py from the glyphs drawn below. The font is only
+# parsed here, main.py imports the resulting table as a plain literal.
+
+from pathlib import Path
+
+ASCII_PRINTABLE_FIRST = 32  # space
+OUTPUT = Path(__file__).resolve().parent.parent / "font_data.py"
+
+
+def main():
+    font = get_font()
+    lines = [
+        "# Generated by tools/gen_font.py, edit the glyphs there and rerun it.",
+        "",
+        "# one glyph per printable ASCII character, indexed by digit. Bit x * 7 + y",
+        "# is the pixel in column x and row y, so a glyph's bits follow the same",
+        "# week per column day order as the contribution graph.",
+        "GLYPHS = (",
+    ]
+
+    for digit, glyph in enumerate(font):
+        bits = 0
+        for x in range(len(glyph[0])):
+            for y in range(7):
+                if glyph[y][x] == "#":
+                    bits |= 1 << (x * 7 + y)
+
+        lines.append(f"    0x{bits:X},  # {chr(digit + ASCII_PRINTABLE_FIRST)!r}")
+
+    lines.append(")")
+    lines.append("")
+    lines.append("# the number of columns in each glyph")
+    lines.append("WIDTHS = (")
+
+    for digit, glyph in enumerate(font):
+        lines.append(f"    {len(glyph[0])},  # {chr(digit + ASCII_PRINTABLE_FIRST)!r}")
+
+    lines.append(")")
+    OUTPUT.write_text("\n".join(lines) + "\n")
+
+
+def get_font():
+    font = """
+        ..
+        ..
+        ..
+        ..
+        ..
+        ..
+        ..
+
+        .
+        #
+        #
+        #
+        .
+        #
+        .
+
+        ...
+        #.#
+        #.#
+        ...
+        ...
+        ...
+        ...
+
+        .....
+        .#.#.
+        #####
+        .#.#.
+        #####
+        .#.#.
+        .....
+
+        ..#..
+        .####
+        #.#..
+        .###.
+        ..#.#
+        ####.
+        ..#..
+
+        .....
+        ##..#
+        ##.#.
+        ..#..
+        .#.##
+        #..##
+        .....
+
+        .##..
+        #..#.
+        .#...
+        .##..
+        #.#.#
+        #..##
+        .##.#
+
+        .
+        #
+        #
+        .
+        .
+        .
+        .
+
+
+        .#
+        #.
+        #.
+        #.
+        #.
+        #.
+        .#
+
+
+        #.
+        .#
+        .#
+        .#
+        .#
+        .#
+        #.
+
+        ...
+        .#.
+        ###
+        .#.
+        ...
+        ...
+        ...
+
+        ...
+        ...
+        .#.
+        ###
+        .#.
+        ...
+        ...
+
+        .
+        .
+        .
+        .
+        .
+        #
+        #
+
+        ...
+        ...
+        ...
+        ###
+        ...
+        ...
+        ...
+
+        .
+        .
+        .
+        .
+        .
+        #
+        .
+
+        .....
+        ....#
+        ...#.
+        ..#..
+        .#...
+        #....
+        .....
+
+        ....
+        .##.
+        #..#
+        #..#
+        #..#
+        .##.
+        ....
+
+        ...
+        .#.
+        ##.
+        .#.
+        .#.
+        ###
+        ...
+
+        ....
+        .##.
+        #..#
+        ..#.
+        #...
+        ####
+        ....
+
+        ....
+        ###.
+        ...#
+        .##.
+        ...#
+        ###.
+        ....
+
+        ....
+        ..#.
+        .##.
+        #.#.
+        ####
+        ..#.
+        ....
+
+        ....
+        ####
+        #...
+        ###.
+        ...#
+        ###.
+        ....
+
+        ....
+        .##.
+        #...
+        ###.
+        #..#
+        .##.
+        ....
+
+        ....
+        ####
+        ...#
+        ..#.
+        .#..
+        #...
+        ....
+
+        ....
+        .##.
+        #..#
+        .##.
+        #..#
+        .##.
+        ....
+
+        ....
+        .##.
+        #..#
+        .###
+        ...#
+        ..#.
+        ....
+
+        .
+        .
+        #
+        .
+        #
+        .
+        .
+
+        .
+        .
+        #
+        .
+        #
+        #
+        .
+
+        ...
+        ..#
+        .#.
+        #..
+        .#.
+        ..#
+        ...
+
+        ...
+        ...
+        ###
+        ...
+        ###
+        ...
+        ...
+
+        ...
+        #..
+        .#.
+        ..#
+        .#.
+        #..
+        ...
+
+        ....
+        .##.
+        ...#
+        ..#.
+        ....
+        ..#.
+        ....
+
+        .....
+        .###.
+        #.#.#
+        #.#.#
+        #.###
+        .##..
+        .....
+
+        ....
+        .##.
+        #..#
+        ####
+        #..#
+        #..#
+        ....
+
+        ....
+        ###.
+        #..#
+        ###.
+        #..#
+        ###.
+        ....
+
+        ....
+        .###
+        #...
+        #...
+        #...
+        .###
+        ....
+
+        ....
+        ##..
+        #.#.
+        #..#
+        #.#.
+        ##..
+        ....
+
+        ....
+        ####
+        #...
+        ###.
+        #...
+        ####
+        ....
+
+        ....
+        ####
+        #...
+        ###.
+        #...
+        #...
+        ....
+
+        ....
+        .###
+        #...
+        #.##
+        #..#
+        .###
+        ....
+
+        ....
+        #..#
+        #..#
+        ####
+        #..#
+        #..#
+        ....
+
+        ...
+        ###
+        .#.
+        .#.
+        .#.
+        ###
+        ...
+
+        ....
+        ...#
+        ...#
+        ...#
+        #..#
+        .##.
+        ....
+
+        ....
+        #..#
+        #.#.
+        ##..
+        #.#.
+        #..#
+        ....
+
+        ....
+        #...
+        #...
+        #...
+        #...
+        ####
+        ....
+
+        .....
+        .#.#.
+        #.#.#
+        #.#.#
+        #...#
+        #...#
+        .....
+
+        .....
+        #...#
+        ##..#
+        #.#.#
+        #..##
+        #...#
+        .....
+
+        ....
+        .##.
+        #..#
+        #..#
+        #..#
+        .##.
+        ....
+
+        ....
+        ###.
+        #..#
+        ###.
+        #...
+        #...
+        ....
+
+        ....
+        .##.
+        #..#
+        #..#
+        #.##
+        .##.
+        ...#
+
+        ....
+        ###.
+        #..#
+        ###.
+        #.#.
+        #..#
+        ....
+
+        ....
+        .###
+        #...
+        .##.
+        ...#
+        ###.
+        ....
+
+        ...
+        ###
+        .#.
+        .#.
+        .#.
+        .#.
+        ...
+
+        ....
+        #..#
+        #..#
+        #..#
+        #..#
+        .##.
+        ....
+
+        ....
+        #..#
+        #..#
+        #..#
+        #.#.
+        .#..
+        ....
+
+        .....
+        #...#
+        #...#
+        #.#.#
+        #.#.#
+        .#.#.
+        .....
+
+        .....
+        #...#
+        .#.#.
+        ..#..
+        .#.#.
+        #...#
+        .....
+
+        ...
+        #.#
+        #.#
+        .#.
+        .#.
+        .#.
+        ...
+
+        ....
+        ####
+        ..#.
+        .#..
+        #...
+        ####
+        ....
+
+        ##
+        #.
+        #.
+        #.
+        #.
+        #.
+        ##
+
+        .....
+        #....
+        .#...
+        ..#..
+        ...#.
+        ....#
+        .....
+
+        ##
+        .#
+        .#
+        .#
+        .#
+        .#
+        ##
+
+        ...
+        .#.
+        #.#
+        ...
+        ...
+        ...
+        ...
+
+        ...
+        ...
+        ...
+        ...
+        ...
+        ###
+        ...
+
+        ..
+        #.
+        .#
+        ..
+        ..
+        ..
+        ..
+
+        ....
+        .##.
+        ...#
+        .###
+        #..#
+        .###
+        ....
+
+        ....
+        #...
+        #...
+        ###.
+        #..#
+        ###.
+        ....
+
+        ...
+        ...
+        ...
+        .##
+        #..
+        .##
+        ...
+
+        ....
+        ...#
+        ...#
+        .###
+        #..#
+        .###
+        ....
+
+        ....
+        ....
+        .##.
+        ####
+        #...
+        .###
+        ....
+
+        ....
+        ..##
+        .#..
+        ###.
+        .#..
+        .#..
+        ....
+
+        ....
+        ....
+        .###
+        #..#
+        .###
+        ...#
+        .##.
+
+        ....
+        #...
+        #...
+        ###.
+        #..#
+        #..#
+        ....
+
+        .
+        #
+        .
+        #
+        #
+        #
+        .
+
+        ...
+        ..#
+        ...
+        ..#
+        ..#
+        ..#
+        ##.
+
+        ...
+        #..
+        #..
+        #.#
+        ##.
+        #.#
+        ...
+
+        .
+        #
+        #
+        #
+        #
+        #
+        .
+
+        .....
+        .....
+        .....
+        .#.#.
+        #.#.#
+        #...#
+        .....
+
+        ....
+        ....
+        ....
+        .##.
+        #..#
+        #..#
+        ....
+
+        ....
+        ....
+        ....
+        .##.
+        #..#
+        .##.
+        ....
+
+        ....
+        ....
+        .##.
+        #..#
+        ###.
+        #...
+        #...
+
+        ....
+        ....
+        .##.
+        #..#
+        .###
+        ...#
+        ...#
+
+        ...
+        ...
+        ...
+        .##
+        #..
+        #..
+        ...
+
+        ....
+        ....
+        .###
+        #...
+        ..##
+        ###.
+        ....
+
+        ...
+        .#.
+        .#.
+        ###
+        .#.
+        .#.
+        ...
+
+        ....
+        ....
+        ....
+        #..#
+        #..#
+        .##.
+        ....
+
+        ....
+        ....
+        ....
+        #..#
+        #.#.
+        .#..
+        ....
+
+        .....
+        .....
+        .....
+        #...#
+        #.#.#
+        .#.#.
+        .....
+
+        ...
+        ...
+        ...
+        #.#
+        .#.
+        #.#
+        ...
+
+        ...
+        ...
+        #.#
+        .##
+        ..#
+        .#.
+        ...
+
+        ...
+        ...
+        ###
+        .#.
+        #..
+        ###
+        ...
+
+        .##
+        .#.
+        .#.
+        #..
+        .#.
+        .#.
+        .##
+
+        .
+        #
+        #
+        #
+        #
+        #
+        .
+
+        ##.
+        .#.
+        .#.
+        ..#
+        .#.
+        .#.
+        ##.
+
+        ......
+        ......
+        .##..#
+        #..##.
+        ......
+        ......
+        ......
+    """.split(
+        "\n\n"
+    )
+
+    return [[row.strip() for row in char.split()] for char in font]
+
+
+main()